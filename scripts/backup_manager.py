@@ -8,6 +8,7 @@ Generates detailed backup reports
 """
 
 import os
+import re
 import sys
 import argparse
 import hashlib
@@ -16,8 +17,95 @@ import json
 import tarfile
 import zipfile
 import subprocess
+import shutil
+import mmap
+import queue
+import threading
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import blake3  # Optional: multi-threaded SIMD hashing
+except ImportError:
+    blake3 = None
+
+try:
+    import zstandard  # Optional: in-process tar.zst when the zstd CLI is missing
+except ImportError:
+    zstandard = None
+
+try:
+    import boto3  # Optional: parallel multipart S3 uploads
+    from boto3.s3.transfer import TransferConfig
+except ImportError:
+    boto3 = None
+
+try:
+    from google.cloud import storage as gcs  # Optional: chunked GCS uploads
+except ImportError:
+    gcs = None
+
+# Copy buffer for archive writes (tarfile/zipfile default to 16 KiB / 8 KiB)
+COPY_BUFSIZE = 2 * 1024 * 1024
+
+# Bound on (path, arcname) pairs queued by source walker threads
+WALK_QUEUE_SIZE = 10_000
+
+CHECKSUM_ALGORITHM = 'blake3' if blake3 else 'sha256'
+
+# zstd level and long-range window (2**27 = 128 MiB, decodable without extra flags)
+ZSTD_LEVEL = 3
+ZSTD_WINDOW_LOG = 27
+
+# External multi-threaded compressors fed with an uncompressed tar stream
+PIPE_COMPRESSORS = {
+    'tar.gz+pigz': ['pigz', '-p', str(os.cpu_count() or 1)],
+    'tar.zst': ['zstd', f'-{ZSTD_LEVEL}', '-T0', f'--long={ZSTD_WINDOW_LOG}', '-q'],
+}
+
+# Multipart settings for boto3 S3 uploads
+S3_TRANSFER_SETTINGS = {
+    'multipart_threshold': 8 * 1024 * 1024,
+    'multipart_chunksize': 16 * 1024 * 1024,
+    'max_concurrency': (os.cpu_count() or 1) * 2,
+    'use_threads': True,
+}
+
+# Resumable upload chunk size for GCS (must be a multiple of 256 KiB)
+GCS_CHUNK_SIZE = 16 * 1024 * 1024
+
+# File extensions for compression formats whose name isn't the extension
+ARCHIVE_EXTENSIONS = {
+    'tar.gz+pigz': 'tar.gz',
+}
+
+class HashingWriter:
+    """Write-only, non-seekable file wrapper that hashes data on its way to disk"""
+    def __init__(self, fileobj, hasher):
+        self.fileobj = fileobj
+        self.hasher = hasher
+        self.name = getattr(fileobj, 'name', '')
+        self.mode = 'wb'
+        self.offset = 0
+
+    def write(self, data):
+        self.hasher.update(data)
+        self.offset += len(data)
+        return self.fileobj.write(data)
+
+    def tell(self):
+        return self.offset
+
+    def flush(self):
+        self.fileobj.flush()
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return False  # Makes zipfile stream entries instead of rewriting headers
 
 class BackupManager:
     def __init__(self, config_file=None):
@@ -33,9 +121,11 @@ class BackupManager:
             'retention_days': 30,
             'exclude_patterns': ['.tmp', '.log', '.cache'],
             'notify_email': None,
-            'cloud_storage': None
+            'cloud_storage': None,
+            'incremental': False
         }
         
+        self.compile_exclude_patterns()
         if config_file and os.path.exists(config_file):
             self.load_config(config_file)
         
@@ -60,6 +150,7 @@ class BackupManager:
             with open(config_file, 'r') as f:
                 user_config = json.load(f)
                 self.config.update(user_config)
+            self.compile_exclude_patterns()
             self.logger.info(f"✅ Configuration loaded from {config_file}")
         except Exception as e:
             self.logger.error(f"❌ Error loading config: {e}")
@@ -92,70 +183,354 @@ class BackupManager:
         
         return errors
 
+    def _scan(self, path):
+        """Recursively yield non-directory entries under path using os.scandir"""
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            yield from self._scan(entry.path)
+                        elif not entry.is_dir():  # Skip symlinks to directories, like os.walk
+                            yield entry
+                    except OSError:
+                        pass  # Skip entries we can't access
+        except OSError:
+            pass  # Skip directories we can't read
+
     def calculate_directory_size(self, path):
         """Calculate total size of directory in bytes"""
         total_size = 0
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                if not os.path.islink(filepath):  # Skip symlinks
-                    try:
-                        total_size += os.path.getsize(filepath)
-                    except OSError:
-                        pass  # Skip files we can't access
+        pending_dirs = [path]  # Explicit stack avoids per-entry generator overhead
+        while pending_dirs:
+            try:
+                with os.scandir(pending_dirs.pop()) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending_dirs.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):  # Skip symlinks
+                                total_size += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            pass  # Skip files we can't access
+            except OSError:
+                pass  # Skip directories we can't read
         return total_size
 
+    def calculate_source_sizes(self, sources):
+        """Calculate sizes of several directories in parallel threads"""
+        # scandir/stat release the GIL, so sources on different disks overlap
+        with ThreadPoolExecutor() as executor:
+            return dict(zip(sources, executor.map(self.calculate_directory_size, sources)))
+
+    def compile_exclude_patterns(self):
+        """Compile exclude_patterns into one substring-matching regex"""
+        patterns = self.config['exclude_patterns']
+        self._exclude_search = None
+        if patterns:
+            self._exclude_search = re.compile('|'.join(map(re.escape, patterns))).search
+
     def should_exclude(self, filepath):
         """Check if file should be excluded from backup"""
-        filename = os.path.basename(filepath)
-        for pattern in self.config['exclude_patterns']:
-            if pattern in filename:
-                return True
-        return False
+        search = self._exclude_search
+        return bool(search and search(os.path.basename(filepath)))
+
+    def get_archive_format(self):
+        """Resolve configured compression to the format that will be produced"""
+        compression = self.config['compression']
+        compressor = PIPE_COMPRESSORS.get(compression)
+        if compressor and not shutil.which(compressor[0]):
+            if compression == 'tar.zst' and zstandard:
+                return compression  # Compressed in-process instead
+            self.logger.warning(f"⚠️  {compressor[0]} not found, falling back to tar.gz")
+            return 'tar.gz'
+        return compression
 
-    def create_backup_archive(self, source_dirs, backup_path):
-        """Create compressed backup archive"""
-        self.logger.info(f"📦 Creating backup archive: {backup_path}")
+    def _source_files(self, source_dir):
+        """Yield (path, arcname) for every non-excluded file in a source directory"""
+        should_exclude = self.should_exclude
+        relpath = os.path.relpath
+        for entry in self._scan(source_dir):
+            path = entry.path
+            if not should_exclude(path):
+                yield path, relpath(path, start=source_dir)
+
+    def _walk_source(self, source_dir, files, stop):
+        """Walker thread: queue a source's files (or the error that stopped it), then a None sentinel"""
+        try:
+            for item in self._source_files(source_dir):
+                if stop.is_set():
+                    break
+                files.put(item)
+        except Exception as e:
+            files.put(e)  # Re-raised by the consumer, as on the single-source path
+        finally:
+            files.put(None)
+
+    def _iter_source_files(self, source_dirs):
+        """Yield (path, arcname) for all sources, walking multiple sources in parallel"""
+        if len(source_dirs) < 2:
+            for source_dir in source_dirs:
+                yield from self._source_files(source_dir)
+            return
+        
+        # One walker thread per source overlaps directory I/O across disks,
+        # while the caller stays the single consumer writing the archive
+        files = queue.Queue(maxsize=WALK_QUEUE_SIZE)
+        stop = threading.Event()
+        walkers = [
+            threading.Thread(target=self._walk_source, args=(source_dir, files, stop), daemon=True)
+            for source_dir in source_dirs
+        ]
+        for walker in walkers:
+            walker.start()
         
+        finished = 0
+        try:
+            while finished < len(walkers):
+                item = files.get()
+                if item is None:
+                    finished += 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            # Unblock walkers if the consumer stopped early
+            stop.set()
+            while finished < len(walkers):
+                if files.get() is None:
+                    finished += 1
+
+    def _changed_files(self, files, manifest, previous_manifest, archive_name):
+        """Filter (path, arcname) pairs to files changed since the previous manifest"""
+        lstat = os.lstat
+        abspath = os.path.abspath
+        get_previous = previous_manifest.get
+        for path, arcname in files:
+            try:
+                stat = lstat(path)
+            except OSError:
+                continue  # Vanished since it was listed
+            key = abspath(path)
+            previous = get_previous(key)
+            if previous and previous[:2] == [stat.st_mtime_ns, stat.st_size]:
+                manifest[key] = previous  # Unchanged: still lives in the older archive
+                continue
+            manifest[key] = [stat.st_mtime_ns, stat.st_size, archive_name]
+            yield path, arcname
+
+    def load_latest_manifest(self, backup_dir):
+        """Load the file manifest of the most recent backup in backup_dir"""
+        manifests = sorted(Path(backup_dir).glob('manifest_*.json'))
+        if not manifests:
+            return {}
+        try:
+            with open(manifests[-1], 'r') as f:
+                return json.load(f)['files']
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning(f"⚠️  Ignoring unreadable manifest {manifests[-1]}: {e}")
+            return {}
+
+    def referenced_backups(self, backup_dir):
+        """Return the names of the latest manifest and every archive it references"""
+        manifests = sorted(Path(backup_dir).glob('manifest_*.json'))
+        if not manifests:
+            return set()
+        files = self.load_latest_manifest(backup_dir)
+        return {manifests[-1].name} | {state[2] for state in files.values()}
+
+    def save_manifest(self, backup_dir, timestamp, backup_path, manifest):
+        """Save the file manifest of a backup next to its archive"""
+        manifest_path = os.path.join(backup_dir, f"manifest_{timestamp}.json")
+        with open(manifest_path + '.partial', 'w') as f:
+            json.dump({'archive': os.path.basename(backup_path), 'files': manifest}, f)
+        os.replace(manifest_path + '.partial', manifest_path)  # Never truncate a linked replica
+        return manifest_path
+
+    def _add_files_to_tar(self, tar, files):
+        """Add (path, arcname) pairs to a tar archive"""
+        add = tar.add
+        for path, arcname in files:
+            add(path, arcname=arcname, recursive=False)
+
+    def _pump(self, src, dst, errors):
+        """Copy a subprocess's output into dst, draining src if dst fails"""
+        try:
+            shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+        except Exception as e:
+            errors.append(e)
+            while src.read(COPY_BUFSIZE):
+                pass  # Keep the process from blocking on a full pipe
+
+    def _start_pump(self, src, dst):
+        """Start copying a subprocess's output into dst on a background thread"""
+        errors = []
+        pump = threading.Thread(target=self._pump, args=(src, dst, errors), daemon=True)
+        pump.start()
+        return pump, errors
+
+    def _finish_process(self, proc, pump, name):
+        """Close a pipeline process's input and raise if it or its output pump failed"""
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass  # The process exited early; its stderr and exit status say why
+        stderr = proc.stderr.read().decode(errors='replace')
+        proc.wait()
+        if pump:
+            pump[0].join()
+        if proc.returncode != 0:
+            raise RuntimeError(f"{name} failed: {stderr.strip()}")
+        if pump and pump[1]:
+            raise pump[1][0]
+
+    def _process_stdout(self, out):
+        """Let a process write to out directly unless its bytes must pass through Python"""
+        return subprocess.PIPE if isinstance(out, HashingWriter) else out
+
+    def _passphrase_fd(self, encryption_key):
+        """Return the read end of a pipe holding the passphrase, for gpg --passphrase-fd"""
+        # Hand the passphrase over a separate pipe so it never shows up in argv
+        passphrase_read, passphrase_write = os.pipe()
+        try:
+            with os.fdopen(passphrase_write, 'w') as passphrase:
+                passphrase.write(encryption_key + '\n')
+        except Exception:
+            os.close(passphrase_read)
+            raise
+        return passphrase_read
+
+    @contextmanager
+    def _encrypted_output(self, out, encryption_key):
+        """Yield a pipe whose data is encrypted by GPG into out"""
+        passphrase_fd = self._passphrase_fd(encryption_key)
         try:
-            if self.config['compression'] == 'zip':
-                with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for source_dir in source_dirs:
-                        for root, dirs, files in os.walk(source_dir):
-                            for file in files:
-                                file_path = os.path.join(root, file)
-                                if not self.should_exclude(file_path):
-                                    arcname = os.path.relpath(file_path, start=source_dir)
-                                    zipf.write(file_path, arcname)
+            proc = subprocess.Popen(
+                ['gpg', '--batch', '--yes', '--passphrase-fd', str(passphrase_fd),
+                 '--symmetric', '--cipher-algo', 'AES256'],
+                stdin=subprocess.PIPE, stdout=self._process_stdout(out),
+                stderr=subprocess.PIPE, pass_fds=(passphrase_fd,)
+            )
+        finally:
+            os.close(passphrase_fd)
+        
+        pump = self._start_pump(proc.stdout, out) if proc.stdout else None
+        try:
+            yield proc.stdin
+        finally:
+            self._finish_process(proc, pump, 'Encryption')
+
+    def _create_piped_tar(self, files, out, compressor):
+        """Stream an uncompressed tar into an external compressor process"""
+        proc = subprocess.Popen(compressor, stdin=subprocess.PIPE,
+                                stdout=self._process_stdout(out), stderr=subprocess.PIPE)
+        pump = self._start_pump(proc.stdout, out) if proc.stdout else None
+        try:
+            with tarfile.open(fileobj=proc.stdin, mode='w|', bufsize=COPY_BUFSIZE,
+                              copybufsize=COPY_BUFSIZE) as tar:
+                self._add_files_to_tar(tar, files)
+        finally:
+            self._finish_process(proc, pump, compressor[0])
+
+    def _create_zstd_tar(self, files, out):
+        """Write a tar stream compressed with multi-threaded long-range zstd"""
+        params = zstandard.ZstdCompressionParameters.from_level(
+            ZSTD_LEVEL, window_log=ZSTD_WINDOW_LOG, enable_ldm=True, threads=-1
+        )
+        compressor = zstandard.ZstdCompressor(compression_params=params)
+        with compressor.stream_writer(out, closefd=False) as zst, \
+                tarfile.open(fileobj=zst, mode='w|', bufsize=COPY_BUFSIZE,
+                             copybufsize=COPY_BUFSIZE) as tar:
+            self._add_files_to_tar(tar, files)
+
+    def create_backup_archive(self, source_dirs, backup_path, archive_format=None,
+                              encryption_key=None, manifest=None, previous_manifest=None):
+        """Create compressed backup archive, encrypted to backup_path + '.gpg' if a key is given
+
+        If manifest is a dict, only files changed since previous_manifest are
+        archived and manifest is filled with every file's state and archive.
+        """
+        output_path = backup_path + '.gpg' if encryption_key else backup_path
+        self.logger.info(f"📦 Creating backup archive: {output_path}")
+        archive_format = archive_format or self.get_archive_format()
+        self.compile_exclude_patterns()  # Pick up changes made to config since __init__
+        
+        files = self._iter_source_files(source_dirs)
+        if manifest is not None:
+            files = self._changed_files(files, manifest, previous_manifest or {},
+                                        os.path.basename(output_path))
+        
+        # Write under a temporary name and swap it in, so an existing backup of
+        # the same name (and any hard-linked replica of it) is never truncated
+        partial_path = output_path + '.partial'
+        try:
+            # Hash the archive as it is written instead of re-reading it afterwards
+            hasher = self._new_hasher()
+            with open(partial_path, 'wb') as raw:
+                sink = HashingWriter(raw, hasher)
+                if encryption_key:
+                    output = self._encrypted_output(sink, encryption_key)
+                else:
+                    output = nullcontext(sink)
+                
+                with output as out:
+                    if archive_format == 'zip':
+                        with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                            for path, arcname in files:
+                                zinfo = zipfile.ZipInfo.from_file(path, arcname)
+                                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                                with open(path, 'rb') as src, \
+                                        zipf.open(zinfo, 'w', force_zip64=True) as dst:
+                                    shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+                    
+                    elif (archive_format in PIPE_COMPRESSORS
+                          and shutil.which(PIPE_COMPRESSORS[archive_format][0])):
+                        self._create_piped_tar(files, out, PIPE_COMPRESSORS[archive_format])
+                    
+                    elif archive_format == 'tar.zst':
+                        self._create_zstd_tar(files, out)
+                    
+                    else:  # tar.gz by default
+                        with tarfile.open(fileobj=out, mode='w:gz', copybufsize=COPY_BUFSIZE) as tar:
+                            self._add_files_to_tar(tar, files)
+            os.replace(partial_path, output_path)
             
-            else:  # tar.gz by default
-                with tarfile.open(backup_path, 'w:gz') as tar:
-                    for source_dir in source_dirs:
-                        for root, dirs, files in os.walk(source_dir):
-                            for file in files:
-                                file_path = os.path.join(root, file)
-                                if not self.should_exclude(file_path):
-                                    arcname = os.path.relpath(file_path, start=source_dir)
-                                    tar.add(file_path, arcname=arcname)
+            if encryption_key:
+                self.logger.info(f"🔒 Backup encrypted: {output_path}")
             
-            # Calculate checksum
-            file_hash = self.calculate_checksum(backup_path)
-            self.logger.info(f"✅ Backup created successfully: {backup_path}")
+            file_hash = hasher.hexdigest()
+            self.logger.info(f"✅ Backup created successfully: {output_path}")
             self.logger.info(f"🔐 Checksum: {file_hash}")
             
             return True, file_hash
             
         except Exception as e:
             self.logger.error(f"❌ Error creating backup: {e}")
+            try:
+                os.remove(partial_path)
+            except OSError:
+                pass
             return False, None
 
+    def _new_hasher(self):
+        """Create a hash object for CHECKSUM_ALGORITHM"""
+        if blake3:
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        return hashlib.sha256()
+
     def calculate_checksum(self, filepath):
-        """Calculate MD5 checksum of file"""
-        hash_md5 = hashlib.md5()
+        """Calculate BLAKE3 (if installed) or SHA-256 checksum of file"""
+        if blake3:
+            return self._new_hasher().update_mmap(filepath).hexdigest()
+        
         with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            if os.fstat(f.fileno()).st_size == 0:
+                return hashlib.sha256().hexdigest()  # Empty files can't be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
 
     def encrypt_backup(self, filepath, key=None):
         """Encrypt backup file using GPG"""
@@ -169,13 +544,18 @@ class BackupManager:
         
         try:
             encrypted_file = filepath + '.gpg'
+            passphrase_fd = self._passphrase_fd(encryption_key)
             cmd = [
-                'gpg', '--batch', '--yes', '--passphrase', encryption_key,
+                'gpg', '--batch', '--yes', '--passphrase-fd', str(passphrase_fd),
                 '--symmetric', '--cipher-algo', 'AES256',
                 '--output', encrypted_file, filepath
             ]
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True,
+                                        pass_fds=(passphrase_fd,))
+            finally:
+                os.close(passphrase_fd)
             if result.returncode == 0:
                 os.remove(filepath)  # Remove unencrypted version
                 self.logger.info(f"🔒 Backup encrypted: {encrypted_file}")
@@ -188,6 +568,20 @@ class BackupManager:
             self.logger.error(f"❌ Encryption error: {e}")
             return False
 
+    def replicate_backup(self, backup_path, destination):
+        """Hard-link or copy a finished backup into another destination"""
+        target = os.path.join(destination, os.path.basename(backup_path))
+        if os.path.exists(target):
+            if os.path.samefile(backup_path, target):
+                return target  # Already in place, e.g. a destination listed twice
+            os.unlink(target)  # Stale backup of the same name from an earlier run
+        try:
+            os.link(backup_path, target)
+        except OSError:
+            shutil.copyfile(backup_path, target)  # Different filesystem
+        self.logger.info(f"📤 Backup replicated: {target}")
+        return target
+
     def cleanup_old_backups(self, backup_dir):
         """Remove backups older than retention period"""
         self.logger.info("🧹 Cleaning up old backups...")
@@ -195,10 +589,14 @@ class BackupManager:
         retention_days = self.config['retention_days']
         cutoff_time = datetime.datetime.now() - datetime.timedelta(days=retention_days)
         
+        # Incremental backups restore unchanged files from older archives, so the
+        # latest manifest and the archives it references outlive retention
+        keep = self.referenced_backups(backup_dir) if self.config['incremental'] else set()
+        
         deleted_count = 0
         try:
             for item in Path(backup_dir).iterdir():
-                if item.is_file():
+                if item.is_file() and item.name not in keep:
                     stat = item.stat()
                     file_time = datetime.datetime.fromtimestamp(stat.st_mtime)
                     
@@ -219,7 +617,25 @@ class BackupManager:
             return True
             
         try:
-            if cloud_config.get('type') == 's3':
+            if cloud_config.get('type') == 's3' and boto3:
+                # AWS S3 multipart upload, chunks sent in parallel
+                boto3.client('s3').upload_file(
+                    filepath, cloud_config['bucket'], Path(filepath).name,
+                    Config=TransferConfig(**S3_TRANSFER_SETTINGS),
+                    ExtraArgs={'ServerSideEncryption': 'AES256'}
+                )
+                self.logger.info(f"☁️  Backup synced to cloud: {filepath}")
+                return True
+            
+            elif cloud_config.get('type') == 'gcs' and gcs:
+                # Google Cloud Storage chunked resumable upload
+                bucket = gcs.Client().bucket(cloud_config['bucket'])
+                blob = bucket.blob(Path(filepath).name, chunk_size=GCS_CHUNK_SIZE)
+                blob.upload_from_filename(filepath)
+                self.logger.info(f"☁️  Backup synced to cloud: {filepath}")
+                return True
+            
+            elif cloud_config.get('type') == 's3':
                 # AWS S3 sync
                 cmd = [
                     'aws', 's3', 'cp', filepath,
@@ -259,11 +675,13 @@ class BackupManager:
             'success': success,
             'backup_file': backup_path,
             'checksum': checksum,
+            'checksum_algorithm': CHECKSUM_ALGORITHM,
             'duration_seconds': duration.total_seconds(),
             'sources_backed_up': self.config['backup_sources'],
             'destinations_used': self.config['backup_destinations'],
             'compression': self.config['compression'],
             'encryption': self.config['encryption'],
+            'incremental': self.config['incremental'],
             'errors': errors or []
         }
         
@@ -308,57 +726,101 @@ class BackupManager:
         
         # Calculate total size
         total_size = 0
-        for source in self.config['backup_sources']:
-            size = self.calculate_directory_size(source)
+        source_sizes = self.calculate_source_sizes(self.config['backup_sources'])
+        for source, size in source_sizes.items():
             total_size += size
             self.logger.info(f"📁 Source: {source} (Size: {size / (1024**3):.2f} GB)")
         
         self.logger.info(f"💾 Total backup size: {total_size / (1024**3):.2f} GB")
         
-        # Create backup for each destination
+        # Build the backup once, then fan it out to every destination
         success = True
         backup_path = None
         checksum = None
         errors = []
+        archive_format = self.get_archive_format()
+        extension = ARCHIVE_EXTENSIONS.get(archive_format, archive_format)
+        destinations = self.config['backup_destinations']
+        completed = []
+        artifacts = []
+        replicas = []
         
-        for destination in self.config['backup_destinations']:
-            try:
-                # Create backup filename with timestamp
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_name = f"backup_{timestamp}.{self.config['compression']}"
-                backup_path = os.path.join(destination, backup_name)
-                
-                # Create backup archive
-                archive_success, checksum = self.create_backup_archive(
-                    self.config['backup_sources'], backup_path
-                )
-                
-                if not archive_success:
-                    errors.append(f"Failed to create archive in {destination}")
+        # Encrypt if enabled, in the same pass that writes the archive
+        encryption_key = self.config['encryption_key'] if self.config['encryption'] else None
+        
+        if self.config['encryption'] and not encryption_key:
+            self.logger.warning("⚠️  Encryption enabled but no key provided")
+            errors.append("Encryption failed: no key provided")
+            success = False
+        
+        else:
+            # Build in the first destination that works; a full or broken disk
+            # only moves the build to the next one
+            for index, primary in enumerate(destinations):
+                try:
+                    # Create backup filename with timestamp
+                    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                    backup_name = f"backup_{timestamp}.{extension}"
+                    backup_path = os.path.join(primary, backup_name)
+                    
+                    # Incremental backups only archive files changed since the last manifest
+                    manifest = previous_manifest = None
+                    if self.config['incremental']:
+                        manifest = {}
+                        previous_manifest = self.load_latest_manifest(primary)
+                    
+                    # Create backup archive
+                    archive_success, checksum = self.create_backup_archive(
+                        self.config['backup_sources'], backup_path, archive_format,
+                        encryption_key, manifest, previous_manifest
+                    )
+                    if encryption_key:
+                        backup_path += '.gpg'
+                    
+                    if archive_success:
+                        completed.append(primary)
+                        artifacts.append(backup_path)
+                        if manifest is not None:
+                            artifacts.append(self.save_manifest(primary, timestamp, backup_path, manifest))
+                        replicas = destinations[index + 1:]
+                        break
+                    
+                    errors.append(f"Failed to create archive in {primary}")
                     success = False
-                    continue
-                
-                # Encrypt if enabled
-                if self.config['encryption']:
-                    encrypt_success = self.encrypt_backup(backup_path)
-                    if not encrypt_success:
-                        errors.append(f"Encryption failed for {destination}")
-                        success = False
-                        continue
+                    
+                except Exception as e:
+                    errors.append(f"Error in {primary}: {str(e)}")
+                    success = False
+        
+        if completed:
+            with ThreadPoolExecutor() as executor:
+                copy_futures = {
+                    executor.submit(self.replicate_backup, artifact, destination): destination
+                    for destination in replicas for artifact in artifacts
+                }
                 
                 # Sync to cloud if configured
+                cloud_future = None
                 if self.config.get('cloud_storage'):
-                    cloud_success = self.sync_to_cloud(backup_path)
-                    if not cloud_success:
-                        errors.append(f"Cloud sync failed for {destination}")
-                        # Don't mark as complete failure for cloud issues
+                    cloud_future = executor.submit(self.sync_to_cloud, backup_path)
                 
-                # Cleanup old backups
-                self.cleanup_old_backups(destination)
+                failed = set()
+                for future, destination in copy_futures.items():
+                    try:
+                        future.result()
+                    except Exception as e:
+                        errors.append(f"Error in {destination}: {str(e)}")
+                        failed.add(destination)
+                        success = False
+                completed.extend(d for d in replicas if d not in failed)
                 
-            except Exception as e:
-                errors.append(f"Error in {destination}: {str(e)}")
-                success = False
+                if cloud_future and not cloud_future.result():
+                    errors.append(f"Cloud sync failed for {backup_path}")
+                    # Don't mark as complete failure for cloud issues
+        
+        # Cleanup old backups
+        for destination in completed:
+            self.cleanup_old_backups(destination)
         
         # Generate report
         report = self.generate_report(success, backup_path, checksum, start_time, errors)
@@ -386,7 +848,8 @@ def create_sample_config():
         "retention_days": 7,
         "exclude_patterns": [".tmp", ".log", ".cache", "node_modules"],
         "notify_email": None,
-        "cloud_storage": None
+        "cloud_storage": None,
+        "incremental": False
     }
     
     config_file = "backup_config.json"
@@ -430,8 +893,8 @@ def main():
         else:
             print("✅ Configuration is valid")
             total_size = 0
-            for source in backup_mgr.config['backup_sources']:
-                size = backup_mgr.calculate_directory_size(source)
+            source_sizes = backup_mgr.calculate_source_sizes(backup_mgr.config['backup_sources'])
+            for source, size in source_sizes.items():
                 total_size += size
                 print(f"📁 {source}: {size / (1024**3):.2f} GB")
             print(f"💾 Total estimated size: {total_size / (1024**3):.2f} GB")
@@ -13,11 +13,85 @@ Analyzes web server logs for common patterns:
 import re
 import sys
 import argparse
+import heapq
 from collections import Counter, defaultdict
-from datetime import datetime
+from operator import itemgetter
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
+try:
+    import re2 as regex_engine  # Optional: linear-time RE2 engine (google-re2)
+except ImportError:
+    regex_engine = re
+
+try:
+    import ahocorasick  # Optional: pyahocorasick multi-pattern matcher
+except ImportError:
+    ahocorasick = None
+
+# Common log format regex (Nginx/Apache)
+LOG_PATTERN = (
+    r'(?P<ip>\S+) - - \[(?P<timestamp>[^\]]+)\] '
+    r'"(?P<method>\w+) (?P<url>\S+) (?P<protocol>[\w/\.]+)" '
+    r'(?P<status>\d+) (?P<size>\d+) "(?P<referrer>[^"]*)" '
+    r'"(?P<user_agent>[^"]*)"'
+)
+_LOG_RE = regex_engine.compile(LOG_PATTERN.encode())  # Matched against raw bytes lines
+
+# LOG_PATTERN group names in group order; RE2 reports bytes group names for
+# bytes patterns, so entries are built from m.groups() by position instead
+LOG_FIELDS = tuple(re.compile(LOG_PATTERN).groupindex)
+
+# Field detection for lines that don't match LOG_PATTERN
+_FALLBACK_IP_RE = re.compile(r'\d+\.\d+\.\d+\.\d+')
+_FALLBACK_STATUS_RE = re.compile(r'^\d{3}$')
+
+# Common attack patterns in URLs (matched against the lowercased URL)
+ATTACK_PATTERNS = [
+    ('SQL Injection', ['union select', 'or 1=1', 'drop table', 'insert into']),
+    ('XSS', ['<script>', 'javascript:', 'onload=', 'onerror=']),
+    ('Path Traversal', ['../', '..\\', '/etc/passwd']),
+    ('Command Injection', [';ls', '|cat', '`id`', '$(whoami)'])
+]
+
+# Single alternation over every attack pattern, used to skip clean URLs in one scan
+_ATTACK_RE = regex_engine.compile('|'.join(
+    re.escape(pattern) for _, patterns in ATTACK_PATTERNS for pattern in patterns
+))
+
+# Aho-Corasick automaton reporting every attack pattern in one pass per URL
+_ATTACK_AUTOMATON = None
+if ahocorasick:
+    _ATTACK_AUTOMATON = ahocorasick.Automaton()
+    for _, patterns in ATTACK_PATTERNS:
+        for pattern in patterns:
+            _ATTACK_AUTOMATON.add_word(pattern, pattern)
+    _ATTACK_AUTOMATON.make_automaton()
+
+# Read buffer for log files (Python's default is 8 KiB)
+READ_BUFSIZE = 1024 * 1024
+
+# Counters fed from buffered entry fields, in LogAnalyzer._pending order
+PENDING_COUNTERS = ('status_codes', 'top_pages', 'top_ips',
+                    'hourly_activity', 'user_agents', 'referrers')
+
+# Lines between folding buffered fields into the counters
+FLUSH_LINES = 1_000_000
+
+# Once top_pages/top_ips exceed TOP_COUNTER_CAP keys, only the TOP_COUNTER_KEEP
+# most common (plus up to TOP_COUNTER_KEEP URLs matching attack patterns) are
+# kept to bound memory
+TOP_COUNTER_CAP = 100_000
+TOP_COUNTER_KEEP = 10_000
+
+# Logs at least this large are split into byte ranges parsed in worker processes
+PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+
+# Smallest byte range handed to a worker
+PARALLEL_CHUNK_BYTES = 4 * 1024 * 1024
+
 class LogAnalyzer:
     def __init__(self, log_file):
         self.log_file = log_file
@@ -31,14 +105,10 @@ class LogAnalyzer:
             'user_agents': Counter(),
             'referrers': Counter()
         }
+        self.log_pattern = _LOG_RE
         
-        # Common log format regex (Nginx/Apache)
-        self.log_pattern = re.compile(
-            r'(?P<ip>\S+) - - \[(?P<timestamp>[^\]]+)\] '
-            r'"(?P<method>\w+) (?P<url>\S+) (?P<protocol>[\w/\.]+)" '
-            r'(?P<status>\d+) (?P<size>\d+) "(?P<referrer>[^"]*)" '
-            r'"(?P<user_agent>[^"]*)"'
-        )
+        # Per-counter field buffers, folded into self.stats by _flush_pending
+        self._pending = tuple([] for _ in PENDING_COUNTERS)
 
     def parse_log_file(self):
         """Parse the log file and extract relevant information"""
@@ -49,18 +119,14 @@ class LogAnalyzer:
         print(f"📖 Reading log file: {self.log_file}")
         
         try:
-            with open(self.log_file, 'r', encoding='utf-8', errors='ignore') as file:
-                for line_num, line in enumerate(file, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                        
-                    match = self.log_pattern.match(line)
-                    if match:
-                        self._process_log_entry(match.groupdict(), line_num)
-                    else:
-                        # Try to parse with simpler pattern for different formats
-                        self._parse_fallback(line, line_num)
+            size = os.path.getsize(self.log_file)
+            workers = os.cpu_count() or 1
+            if workers > 1 and size >= PARALLEL_MIN_BYTES:
+                self._parse_parallel(size, workers)
+            else:
+                # Binary mode: only the fields that get stored are ever decoded
+                with open(self.log_file, 'rb', buffering=READ_BUFSIZE) as file:
+                    self._parse_lines(file)
                         
             return True
             
@@ -68,73 +134,145 @@ class LogAnalyzer:
             print(f"❌ Error reading log file: {e}")
             return False
 
-    def _process_log_entry(self, entry, line_num):
-        """Process a single log entry"""
-        self.stats['total_requests'] += 1
+    def _parse_parallel(self, size, workers):
+        """Parse byte ranges of the log in worker processes and merge their stats"""
+        chunk_size = max(PARALLEL_CHUNK_BYTES, size // (workers * 8))
+        starts = range(0, size, chunk_size)
+        ends = [min(start + chunk_size, size) for start in starts]
+        
+        # map() yields in chunk order, so merged counters keep first-seen key order
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for stats in executor.map(_parse_chunk, repeat(self.log_file), starts, ends):
+                self.stats['total_requests'] += stats['total_requests']
+                for key in PENDING_COUNTERS:
+                    self.stats[key].update(stats[key])
+                self._prune_top_counters()
+
+    def _parse_lines(self, lines):
+        """Parse an iterable of raw (bytes) log lines into the stats counters"""
+        # Bind hot lookups to locals once instead of once per line
+        match = _LOG_RE.match
+        process = self._process_log_entry
+        fields = LOG_FIELDS
+        fallback = self._parse_fallback
+        flush = self._flush_pending
+        pending = self._pending
+        parsed = 0
+        
+        for line_num, line in enumerate(lines, 1):
+            if not line_num % FLUSH_LINES:
+                flush()
+            
+            line = line.strip()
+            if not line:
+                continue
+                
+            m = match(line)
+            if m:
+                process(dict(zip(fields, m.groups())), line_num, pending)
+                parsed += 1
+            else:
+                # Try to parse with simpler pattern for different formats
+                fallback(line.decode('utf-8', errors='ignore'), line_num, pending)
+        
+        flush()
+        self.stats['total_requests'] += parsed
+
+    def _flush_pending(self):
+        """Fold buffered entry fields into the stats counters in one C-level pass each"""
+        for key, values in zip(PENDING_COUNTERS, self._pending):
+            self.stats[key].update(values)
+            values.clear()
+        self._prune_top_counters()
+
+    def _prune_top_counters(self):
+        """Drop rarely seen pages/IPs from high-cardinality counters"""
+        for key in ('top_pages', 'top_ips'):
+            counter = self.stats[key]
+            if len(counter) <= TOP_COUNTER_CAP:
+                continue
+            
+            keep = {k for k, _ in heapq.nlargest(TOP_COUNTER_KEEP, counter.items(),
+                                                 key=itemgetter(1))}
+            if key == 'top_pages':
+                # Rare URLs are often attack attempts; keep the most frequent of
+                # those too for _check_security_issues, still bounded by TOP_COUNTER_KEEP
+                find_patterns = self._find_attack_patterns
+                attacks = (item for item in counter.items()
+                           if item[0] not in keep and find_patterns(item[0].lower()))
+                keep.update(url for url, _ in heapq.nlargest(TOP_COUNTER_KEEP, attacks,
+                                                             key=itemgetter(1)))
+            
+            # Rebuild in original order so ties still report in first-seen order
+            self.stats[key] = Counter({k: v for k, v in counter.items() if k in keep})
+
+    def _process_log_entry(self, entry, line_num, pending=None):
+        """Buffer the fields of a single log entry (see _flush_pending)
+
+        Fields are bytes; only the values stored in the counters are decoded.
+        The caller (_parse_lines) counts the entry in total_requests.
+        """
+        status_codes, top_pages, top_ips, hourly_activity, user_agents, referrers = \
+            pending or self._pending
         
         # Status codes
-        status = entry['status']
-        self.stats['status_codes'][status] += 1
+        status_codes.append(entry['status'].decode('ascii'))
         
         # Top pages (URLs)
-        url = entry['url']
-        self.stats['top_pages'][url] += 1
+        top_pages.append(entry['url'].decode('utf-8', errors='ignore'))
         
         # Top IPs
-        ip = entry['ip']
-        self.stats['top_ips'][ip] += 1
+        top_ips.append(entry['ip'].decode('utf-8', errors='ignore'))
         
-        # Hourly activity
-        try:
-            timestamp_str = entry['timestamp'].split()[0]  # Get date part
-            dt = datetime.strptime(timestamp_str, '%d/%b/%Y:%H:%M:%S')
-            hour = dt.strftime('%H:00')
-            self.stats['hourly_activity'][hour] += 1
-        except:
-            pass
+        # Hourly activity, sliced straight out of "dd/Mon/YYYY:HH:MM:SS +zone"
+        timestamp = entry['timestamp']
+        hour = timestamp[12:14]
+        if timestamp[11:12] == b':' and hour.isdigit():
+            hourly_activity.append(hour.decode('ascii') + ':00')
         
         # User agents (simplified)
-        if entry['user_agent'] and entry['user_agent'] != '-':
+        if entry['user_agent'] and entry['user_agent'] != b'-':
             # Extract browser name from user agent
             ua = entry['user_agent'].lower()
-            if 'chrome' in ua:
+            if b'chrome' in ua:
                 browser = 'Chrome'
-            elif 'firefox' in ua:
+            elif b'firefox' in ua:
                 browser = 'Firefox'
-            elif 'safari' in ua and 'chrome' not in ua:
+            elif b'safari' in ua and b'chrome' not in ua:
                 browser = 'Safari'
-            elif 'edge' in ua:
+            elif b'edge' in ua:
                 browser = 'Edge'
-            elif 'bot' in ua or 'crawler' in ua:
+            elif b'bot' in ua or b'crawler' in ua:
                 browser = 'Bot/Crawler'
             else:
                 browser = 'Other'
-            self.stats['user_agents'][browser] += 1
+            user_agents.append(browser)
         
         # Referrers
-        if entry['referrer'] and entry['referrer'] != '-':
-            self.stats['referrers'][entry['referrer']] += 1
+        if entry['referrer'] and entry['referrer'] != b'-':
+            referrers.append(entry['referrer'].decode('utf-8', errors='ignore'))
 
-    def _parse_fallback(self, line, line_num):
+    def _parse_fallback(self, line, line_num, pending=None):
         """Fallback parsing for different log formats"""
+        status_codes, top_pages, top_ips = (pending or self._pending)[:3]
         parts = line.split()
         if len(parts) >= 7:
             # Simple IP detection (first part that looks like IP)
             for part in parts:
-                if re.match(r'\d+\.\d+\.\d+\.\d+', part):
-                    self.stats['top_ips'][part] += 1
+                if _FALLBACK_IP_RE.match(part):
+                    top_ips.append(part)
                     break
             
             # Look for status codes (3-digit numbers)
             for part in parts:
-                if re.match(r'^\d{3}$', part):
-                    self.stats['status_codes'][part] += 1
+                if _FALLBACK_STATUS_RE.match(part):
+                    status_codes.append(part)
                     break
             
             # Look for URLs (containing /)
             for part in parts:
                 if '/' in part and 'HTTP' not in part:
-                    self.stats['top_pages'][part] += 1
+                    top_pages.append(part)
                     break
             
             self.stats['total_requests'] += 1
@@ -218,20 +356,30 @@ class LogAnalyzer:
                     print(f"   ⚠️  Suspicious user agent detected: {ua}")
         
         # Check for common attack patterns in URLs
-        attack_patterns = [
-            ('SQL Injection', ['union select', 'or 1=1', 'drop table', 'insert into']),
-            ('XSS', ['<script>', 'javascript:', 'onload=', 'onerror=']),
-            ('Path Traversal', ['../', '..\\', '/etc/passwd']),
-            ('Command Injection', [';ls', '|cat', '`id`', '$(whoami)'])
-        ]
+        find_patterns = self._find_attack_patterns
+        suspicious_urls = []
+        for url in self.stats['top_pages']:
+            found = find_patterns(url.lower())
+            if found:
+                suspicious_urls.append((url, found))
         
-        for pattern_name, patterns in attack_patterns:
-            for url in self.stats['top_pages']:
-                url_lower = url.lower()
+        for pattern_name, patterns in ATTACK_PATTERNS:
+            for url, found in suspicious_urls:
                 for pattern in patterns:
-                    if pattern in url_lower:
+                    if pattern in found:
                         print(f"   ⚠️  Possible {pattern_name} attempt: {url}")
 
+    def _find_attack_patterns(self, url_lower):
+        """Return the set of attack patterns occurring in a lowercased URL"""
+        if _ATTACK_AUTOMATON is not None:
+            return {pattern for _, pattern in _ATTACK_AUTOMATON.iter(url_lower)}
+        
+        # Without pyahocorasick, skip clean URLs with one combined regex scan
+        if not _ATTACK_RE.search(url_lower):
+            return set()
+        return {pattern for _, patterns in ATTACK_PATTERNS
+                for pattern in patterns if pattern in url_lower}
+
     def save_report(self, output_file):
         """Save report to file"""
         try:
@@ -244,6 +392,28 @@ class LogAnalyzer:
         except Exception as e:
             print(f"❌ Error saving report: {e}")
 
+def _read_chunk_lines(log_file, start, end):
+    """Yield the raw (bytes) lines that start within [start, end) of a log file"""
+    with open(log_file, 'rb', buffering=READ_BUFSIZE) as file:
+        if start:
+            # Skip the line straddling start; the previous chunk owns it
+            file.seek(start - 1)
+            position = start - 1 + len(file.readline())
+        else:
+            position = 0
+        while position < end:
+            line = file.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line
+
+def _parse_chunk(log_file, start, end):
+    """Worker process: parse one byte range of a log file and return its stats"""
+    analyzer = LogAnalyzer(log_file)
+    analyzer._parse_lines(_read_chunk_lines(log_file, start, end))
+    return analyzer.stats
+
 def create_sample_log():
     """Create a sample log file for testing"""
     sample_log = """192.168.1.100 - - [25/Dec/2023:10:15:32 +0000] "GET /index.html HTTP/1.1" 200 1524 "https://example.com" "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"